@@ -1,9 +1,17 @@
 import difflib
 import fnmatch
+import functools
+import io
+import mmap
 import os
 import re
+import shutil
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from html import escape as html_escape
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 import dash
 import dash.exceptions
@@ -13,8 +21,20 @@ from dash import dcc, html, Input, Output, State, ALL
 from dash._dash_renderer import _set_react_version
 from dash_iconify import DashIconify
 
+try:
+    from diff_match_patch import diff_match_patch
+except ImportError:
+    diff_match_patch = None
+
 _set_react_version("18.2.0")
 
+# The semantic differ (diff-match-patch) is much faster than difflib for
+# interactive previews; set PROMPTER_STRICT_DIFF=1 to force the strict
+# minimal-edit-script difflib rendering instead.
+USE_SEMANTIC_DIFF = (
+    diff_match_patch is not None and os.environ.get("PROMPTER_STRICT_DIFF") != "1"
+)
+
 EXTENSION_PRESETS = {
     "None": ".py, .js, .ts, .html, .css, .json",
     "Academic Code": ".py, .ipynb, .r, .csv, .txt",
@@ -55,6 +75,13 @@ PRESET_EXCLUSION_MAP = {
     "Data Science": {"venv", ".ipynb_checkpoints"},
 }
 
+# Both exclusion tables are constants, so the per-preset exclusion text can
+# be joined once at import instead of re-unioned on every preset change.
+_PRESET_EXCL_TEXT = {
+    label: ", ".join(sorted(BASE_EXCLUSIONS | PRESET_EXCLUSION_MAP.get(label, set())))
+    for label in EXTENSION_PRESETS
+}
+
 PROMPT_LIBRARY = {
     "None (No Template)": "",
     "Academic Code": "Check academic code correctness. If needed, propose short fixes.",
@@ -68,6 +95,11 @@ PROMPT_LIBRARY = {
     "Testing Strategy": "Propose a concise testing strategy for the given code or system.",
 }
 
+# Dropdown options are static, so sort and box them once at import instead
+# of on every layout build.
+_EXTENSION_OPTIONS = [{"label": k, "value": k} for k in sorted(EXTENSION_PRESETS)]
+_PROMPT_OPTIONS = [{"label": k, "value": k} for k in sorted(PROMPT_LIBRARY)]
+
 
 class LLMUpdateParser:
     """
@@ -79,178 +111,454 @@ class LLMUpdateParser:
     """
 
     def parse_response(self, text: str) -> (List[Dict[str, str]], str):
-        lines = text.splitlines()
+        # Parsing is stateless, so repeated callback invocations with the
+        # same response text hit the module-level cache.
+        return _parse_llm_response(text)
+
+
+# One compiled pass over the whole response: a block is a 'file:' line, the
+# START marker, the body, and the END marker.
+_BLOCK_RE = re.compile(
+    r"^[ \t]*file:[ \t]*(?P<filename>[^\r\n]+?)[ \t]*\r?\n"
+    r"[ \t]*--- START CODE ---[ \t]*\r?\n"
+    r"(?P<body>.*?)"
+    r"^[ \t]*--- END CODE ---[ \t]*$",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+_FILE_LINE_RE = re.compile(r"^[ \t]*file:", re.IGNORECASE | re.MULTILINE)
+
+_START_MARKER = "--- START CODE ---"
+_END_MARKER = "--- END CODE ---"
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_llm_response(text: str) -> (List[Dict[str, str]], str):
+    # Fast path: one C-level regex scan. If every 'file:' line produced a
+    # complete block the response is well-formed; otherwise rerun the line
+    # parser, which reports exactly where the format broke.
+    matches = list(_BLOCK_RE.finditer(text))
+    if matches and len(matches) == len(_FILE_LINE_RE.findall(text)):
         blocks = []
-        error_message = ""
-
-        current_file = None
-        current_code = []
-        expecting_start = False
-        in_code_block = False
-
-        for idx, line in enumerate(lines):
-            line_stripped = line.strip()
-
-            # Detect 'file:'
-            if line_stripped.lower().startswith("file:"):
-                # If we were still in a code block, that means we didn't see '--- END CODE ---'
-                if in_code_block:
-                    error_message = f"Missing '--- END CODE ---' before starting new file block at line {idx+1}"
-                    return [], error_message
-
-                parts = line_stripped.split(":", 1)
-                if len(parts) < 2:
-                    error_message = f"Invalid file line at line {idx+1}"
-                    return [], error_message
-
-                filename = parts[1].strip()
-                current_file = filename
-                current_code = []
-                expecting_start = True
+        for m in matches:
+            body = m.group("body")
+            if body.endswith("\r\n"):
+                body = body[:-2]
+            elif body.endswith("\n"):
+                body = body[:-1]
+            if "\r" in body:
+                body = "\n".join(body.splitlines())
+            blocks.append({"filename": m.group("filename"), "new_content": body})
+        return blocks, ""
+    return _parse_llm_response_lines(text)
+
+
+def _parse_llm_response_lines(text: str) -> (List[Dict[str, str]], str):
+    lines = text.splitlines()
+    blocks = []
+    error_message = ""
+
+    current_file = None
+    current_code = io.StringIO()
+    expecting_start = False
+    in_code_block = False
+
+    for idx, line in enumerate(lines):
+        if in_code_block:
+            # Fast path for the hot loop: content lines rarely contain the
+            # end marker, so one substring scan avoids a strip()/lower()
+            # allocation per line.
+            if _END_MARKER in line and line.strip() == _END_MARKER:
+                # End of this file's code block; drop the trailing newline
+                # added after the last written line.
+                buffered = current_code.getvalue()
+                blocks.append(
+                    {
+                        "filename": current_file,
+                        "new_content": buffered[:-1] if buffered else "",
+                    }
+                )
                 in_code_block = False
+                current_file = None
+                current_code = io.StringIO()
                 continue
+            # A new 'file:' line means we didn't see '--- END CODE ---'
+            if ":" in line and line.lstrip()[:5].lower() == "file:":
+                error_message = f"Missing '--- END CODE ---' before starting new file block at line {idx+1}"
+                return [], error_message
+            current_code.write(line)
+            current_code.write("\n")
+            continue
 
-            if expecting_start:
-                if line_stripped == "--- START CODE ---":
-                    expecting_start = False
-                    in_code_block = True
-                else:
-                    error_message = (
-                        f"Expected '--- START CODE ---' after file line for file '{current_file}' "
-                        f"but got '{line_stripped}' at line {idx+1}"
-                    )
-                    return [], error_message
-                continue
+        line_stripped = line.strip()
 
-            if in_code_block:
-                if line_stripped == "--- END CODE ---":
-                    # End of this file's code block
-                    blocks.append(
-                        {
-                            "filename": current_file,
-                            "new_content": "\n".join(current_code),
-                        }
-                    )
-                    in_code_block = False
-                    current_file = None
-                    current_code = []
-                else:
-                    current_code.append(line)
-                continue
+        # Detect 'file:'
+        if line_stripped.lower().startswith("file:"):
+            parts = line_stripped.split(":", 1)
+            if len(parts) < 2:
+                error_message = f"Invalid file line at line {idx+1}"
+                return [], error_message
 
-        # If we never saw '--- END CODE ---' for some block
-        if in_code_block:
-            error_message = f"Missing '--- END CODE ---' for file '{current_file}'"
-            return [], error_message
+            filename = parts[1].strip()
+            current_file = filename
+            current_code = io.StringIO()
+            expecting_start = True
+            in_code_block = False
+            continue
+
+        if expecting_start:
+            if line_stripped == _START_MARKER:
+                expecting_start = False
+                in_code_block = True
+            else:
+                error_message = (
+                    f"Expected '--- START CODE ---' after file line for file '{current_file}' "
+                    f"but got '{line_stripped}' at line {idx+1}"
+                )
+                return [], error_message
+            continue
 
-        return blocks, error_message
+    # If we never saw '--- END CODE ---' for some block
+    if in_code_block:
+        error_message = f"Missing '--- END CODE ---' for file '{current_file}'"
+        return [], error_message
 
+    return blocks, error_message
 
+
+@functools.lru_cache(maxsize=256)
 def generate_side_by_side_diff(original: str, new_content: str, filename: str) -> str:
     if not original and not new_content:
         return f"File '{filename}' is empty both before and after."
-    diff_html = difflib.HtmlDiff(wrapcolumn=80).make_table(
-        original.splitlines(),
-        new_content.splitlines(),
-        fromdesc=f"a/{filename}",
-        todesc=f"b/{filename}",
+    if USE_SEMANTIC_DIFF:
+        dmp = diff_match_patch()
+        # Abort pathological inputs rather than hanging the callback.
+        dmp.Diff_Timeout = 1.0
+        diffs = dmp.diff_main(original, new_content)
+        dmp.diff_cleanupSemantic(diffs)
+        return dmp.diff_prettyHtml(diffs)
+    return _difflib_side_by_side(original, new_content, filename)
+
+
+_DIFF_CONTEXT_LINES = 3
+
+# Styles for the hand-rolled side-by-side table; classes keep each row small
+# compared to HtmlDiff's inline attributes per cell.
+_DIFF_CSS = (
+    "<style>"
+    "table.sbsdiff{border-collapse:collapse;font-family:monospace;"
+    "font-size:12px;width:100%;}"
+    "table.sbsdiff th{background-color:#f0f0f0;text-align:left;padding:2px 6px;}"
+    "table.sbsdiff td{vertical-align:top;white-space:pre-wrap;padding:1px 6px;}"
+    "table.sbsdiff td.lineno{color:#999;text-align:right;width:1%;}"
+    "table.sbsdiff td.add{background-color:#ddffdd;}"
+    "table.sbsdiff td.sub{background-color:#ffdddd;}"
+    "table.sbsdiff td.chg{background-color:#ffffcc;}"
+    "</style>"
+)
+
+_EMPTY_CELL = '<td class="lineno"></td><td></td>'
+
+
+def _diff_cell(lineno: int, text: str, cls: str) -> str:
+    td = f'<td class="{cls}">' if cls else "<td>"
+    return f'<td class="lineno">{lineno}</td>{td}{html_escape(text)}</td>'
+
+
+def _render_side_by_side(
+    a: List[str], b: List[str], filename: str, offset: int = 0
+) -> str:
+    """
+    Emit the side-by-side table from SequenceMatcher opcodes with one final
+    join, instead of HtmlDiff's per-cell string building.
+    """
+    rows = []
+    append = rows.append
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, a, b).get_opcodes():
+        if tag == "equal":
+            for k in range(i2 - i1):
+                left = _diff_cell(offset + i1 + k + 1, a[i1 + k], "")
+                right = _diff_cell(offset + j1 + k + 1, b[j1 + k], "")
+                append(f"<tr>{left}{right}</tr>")
+            continue
+        left_cls = "chg" if tag == "replace" else "sub"
+        right_cls = "chg" if tag == "replace" else "add"
+        for k in range(max(i2 - i1, j2 - j1)):
+            left = (
+                _diff_cell(offset + i1 + k + 1, a[i1 + k], left_cls)
+                if i1 + k < i2
+                else _EMPTY_CELL
+            )
+            right = (
+                _diff_cell(offset + j1 + k + 1, b[j1 + k], right_cls)
+                if j1 + k < j2
+                else _EMPTY_CELL
+            )
+            append(f"<tr>{left}{right}</tr>")
+    header = (
+        f"<tr><th></th><th>a/{html_escape(filename)}</th>"
+        f"<th></th><th>b/{html_escape(filename)}</th></tr>"
     )
-    return diff_html
+    return f'{_DIFF_CSS}<table class="sbsdiff">{header}{"".join(rows)}</table>'
+
+
+# Above this many table cells (len(a) * len(b)), HtmlDiff becomes too slow
+# and memory-hungry to run in a callback; fall back to a unified diff.
+_HTMLDIFF_MAX_CELLS = 10_000_000
+
+
+def _unified_diff_html(a: List[str], b: List[str], filename: str) -> str:
+    out = []
+    for line in difflib.unified_diff(
+        a, b, fromfile=f"a/{filename}", tofile=f"b/{filename}", lineterm=""
+    ):
+        escaped = html_escape(line)
+        if line.startswith("+"):
+            out.append(f'<span style="background-color:#ddffdd">{escaped}</span>')
+        elif line.startswith("-"):
+            out.append(f'<span style="background-color:#ffdddd">{escaped}</span>')
+        else:
+            out.append(escaped)
+    return "<pre>" + "\n".join(out) + "</pre>"
+
+
+def _trim_common_ends(a: List[str], b: List[str]) -> (int, int):
+    """
+    Length of the common head and tail of two line lists, GNU-diff style:
+    strip the unchanged ends before handing the middle to the O(n*m) differ.
+    """
+    head = 0
+    max_head = min(len(a), len(b))
+    while head < max_head and a[head] == b[head]:
+        head += 1
+    tail = 0
+    max_tail = max_head - head
+    while tail < max_tail and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+    return head, tail
+
+
+def _difflib_side_by_side(original: str, new_content: str, filename: str) -> str:
+    a = original.splitlines()
+    b = new_content.splitlines()
+    head, tail = _trim_common_ends(a, b)
+    # Keep a few unchanged lines around the edit so the table still shows
+    # context, but skip the bulk of a large identical head/tail.
+    head = max(0, head - _DIFF_CONTEXT_LINES)
+    tail = max(0, tail - _DIFF_CONTEXT_LINES)
+    a_mid = a[head : len(a) - tail]
+    b_mid = b[head : len(b) - tail]
+    if len(a_mid) * len(b_mid) > _HTMLDIFF_MAX_CELLS:
+        return _unified_diff_html(a_mid, b_mid, filename)
+    return _render_side_by_side(a_mid, b_mid, filename, offset=head)
+
+
+_WILDCARD_CHARS = frozenset("*?[")
+_HIDDEN_MARKER = os.sep + "."
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_exclusions(exclusion_list: tuple):
+    """
+    Compile an exclusion list once into a frozenset of literal path parts plus
+    a single union regex, so that matching a path is one set intersection and
+    one C-level regex search instead of a Python loop over fnmatch calls.
+    Literal patterns compile to plain escaped substrings; fnmatch.translate is
+    only paid for patterns that actually contain wildcard metacharacters.
+    """
+    parts_set = frozenset(exclusion_list)
+    branches = [
+        (
+            re.escape(p)
+            if not _WILDCARD_CHARS.intersection(p)
+            else fnmatch.translate(f"*{p}*")
+        )
+        for p in exclusion_list
+    ]
+    regex = re.compile("|".join(branches)) if branches else None
+    return parts_set, regex
 
 
 def is_hidden_or_excluded(path: str, exclusion_list: List[str]) -> bool:
-    p = Path(path)
-    if any(part.startswith(".") for part in p.parts):
+    # Cheapest predicate first: a single substring scan rejects the dotted
+    # directories (.git, .ipynb_checkpoints, ...) that dominate filtered
+    # entries, before any splitting or regex work.
+    if path.startswith(".") or _HIDDEN_MARKER in path:
         return True
-    for pattern in exclusion_list:
-        if pattern in p.parts:
-            return True
-        if fnmatch.fnmatch(path, f"*{pattern}*"):
-            return True
-    return False
-
-
-def add_all_files(
-    folder_path: str,
-    base_path: str,
-    extensions: List[str],
-    exclusion_list: List[str],
-    selected_files: List[str],
-):
-    for root, dirs, files in os.walk(folder_path):
-        if is_hidden_or_excluded(root, exclusion_list):
-            dirs[:] = []
-            continue
-        dirs[:] = [
-            d
-            for d in dirs
-            if not is_hidden_or_excluded(os.path.join(root, d), exclusion_list)
-        ]
-        for file in files:
-            full_file_path = os.path.join(root, file)
-            if is_hidden_or_excluded(full_file_path, exclusion_list):
-                continue
-            if any(file.lower().endswith(ext) for ext in extensions):
-                rel_path = os.path.relpath(full_file_path, base_path)
-                if rel_path not in selected_files:
-                    selected_files.append(rel_path)
+    parts_set, regex = _compile_exclusions(tuple(exclusion_list))
+    if parts_set and parts_set.intersection(path.split(os.sep)):
+        return True
+    return regex is not None and bool(regex.search(path))
+
+
+def _is_excluded_name(name: str, exclusion_list: tuple) -> bool:
+    """
+    Leaf-name variant of is_hidden_or_excluded for walk loops. A walk only
+    descends into directories that already passed the check, so each child
+    needs just its own name tested — not a re-scan of the whole ancestor
+    path per entry.
+    """
+    if name.startswith("."):
+        return True
+    parts_set, regex = _compile_exclusions(exclusion_list)
+    if name in parts_set:
+        return True
+    return regex is not None and bool(regex.search(name))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_extension_field(file_ext_string: str) -> tuple:
+    extensions = []
+    for ext in (file_ext_string or "").split(","):
+        e = ext.strip().lower()
+        if e and not e.startswith("."):
+            e = "." + e
+        if e:
+            extensions.append(e)
+    return tuple(extensions)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_exclusion_field(exclusion_string: str) -> tuple:
+    cleaned = set()
+    for x in (exclusion_string or "").split(","):
+        x2 = x.strip()
+        if x2:
+            cleaned.add(x2)
+    return tuple(sorted(cleaned))
+
+
+_READ_CHUNK_SIZE = 256 * 1024
+
+# Above this size, map the file instead of read(2)-ing it so the OS pages it
+# in on demand and overlaps I/O with the decode.
+_MMAP_MIN_SIZE = 64 * 1024
 
 
 def read_entire_file(full_path: str) -> str:
     try:
-        with open(full_path, "r", encoding="utf-8", errors="replace") as f:
-            return f.read()
+        fd = os.open(full_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size <= _MMAP_MIN_SIZE:
+                # One syscall for the common small-source-file case, skipping
+                # the buffered reader and TextIOWrapper entirely.
+                data = os.read(fd, size)
+            else:
+                data = _read_large(fd)
+        finally:
+            os.close(fd)
+        return data.decode("utf-8", errors="replace")
     except Exception as e:
         return f"<!-- Could not read file: {e} -->"
 
 
+def _read_large(fd: int) -> bytes:
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:]
+    except (OSError, ValueError):
+        # Not all filesystems support mapping; fall back to chunked reads.
+        chunks = []
+        while True:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+
+@functools.lru_cache(maxsize=512)
+def _read_cached(full_path: str, mtime_ns: int) -> str:
+    """Mtime-keyed wrapper so repeat reads of an unchanged file hit memory."""
+    return read_entire_file(full_path)
+
+
+# Only probe files up to this size for whitespace-only content; larger files
+# are assumed meaningful rather than paying a full-string strip() to check.
+_EMPTY_CHECK_MAX_SIZE = 16 * 1024
+
+# Files above this size never belong in a prompt verbatim (think a stray CSV
+# that matched the extension filter); replace them with a stub instead of
+# reading them into memory.
+MAX_FILE_BYTES = 2 * 1024 * 1024
+
+# Shared pool for file I/O across callbacks; threads start lazily on first
+# submit and are reused, so repeated prompt generations don't pay thread
+# startup each time.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+
+def _read_for_prompt(full_path: str) -> str:
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        # Let read_entire_file produce its usual inline error comment.
+        return read_entire_file(full_path)
+    if st.st_size == 0:
+        return ""
+    if st.st_size > MAX_FILE_BYTES:
+        return f"<!-- File too large ({st.st_size} bytes) to include -->"
+    # Repeat generations in a session mostly re-read unchanged files; the
+    # mtime-keyed cache turns those into memory hits.
+    content = _read_cached(full_path, st.st_mtime_ns)
+    if st.st_size <= _EMPTY_CHECK_MAX_SIZE and not content.strip():
+        return ""
+    return content
+
+
 def read_selected_files(
     folder_path: str, selected_files: List[str]
-) -> List[Dict[str, str]]:
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield (filename, display_path, content) tuples for the selected files,
+    streaming them to the prompt builder instead of materializing a list of
+    dicts for the whole corpus.
+    """
     base_folder_name = os.path.basename(folder_path.rstrip("/"))
-    source_files = []
-    for rel_path in selected_files:
-        full_path = os.path.join(folder_path, rel_path)
-        display_path = f"{base_folder_name}/{rel_path}"
-        content = read_entire_file(full_path)
-        if not content.strip():
+    full_paths = [os.path.join(folder_path, rel) for rel in selected_files]
+    if not full_paths:
+        return
+    # os.read releases the GIL, so the shared pool overlaps the per-file
+    # syscall latency; executor.map preserves the selection order.
+    for rel_path, content in zip(
+        selected_files, _IO_EXECUTOR.map(_read_for_prompt, full_paths)
+    ):
+        if not content:
             continue
-        source_files.append(
-            {
-                "filename": rel_path,
-                "display_path": display_path,
-                "content": content,
-            }
-        )
-    return source_files
+        yield rel_path, f"{base_folder_name}/{rel_path}", content
+
+
+_LANGUAGE_BY_EXTENSION = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".java": "java",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".cs": "csharp",
+    ".rb": "ruby",
+    ".go": "go",
+    ".php": "php",
+    ".html": "html",
+    ".css": "css",
+    ".json": "json",
+    ".ipynb": "python",
+    ".csv": "",
+    ".txt": "",
+    ".vue": "html",
+    ".swift": "swift",
+    ".kt": "kotlin",
+    ".xml": "xml",
+    ".r": "r",
+}
 
 
+@functools.lru_cache(maxsize=4096)
 def get_language_extension(filename: str) -> str:
-    ext = Path(filename).suffix.lower()
-    mapping = {
-        ".py": "python",
-        ".js": "javascript",
-        ".ts": "typescript",
-        ".java": "java",
-        ".c": "c",
-        ".cpp": "cpp",
-        ".cs": "csharp",
-        ".rb": "ruby",
-        ".go": "go",
-        ".php": "php",
-        ".html": "html",
-        ".css": "css",
-        ".json": "json",
-        ".ipynb": "python",
-        ".csv": "",
-        ".txt": "",
-        ".vue": "html",
-        ".swift": "swift",
-        ".kt": "kotlin",
-        ".xml": "xml",
-        ".r": "r",
-    }
-    return mapping.get(ext, "")
+    i = filename.rfind(".")
+    if i < 0:
+        return ""
+    return _LANGUAGE_BY_EXTENSION.get(filename[i:].lower(), "")
 
 
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
@@ -261,404 +569,459 @@ mantine_theme = {
     "defaultRadius": "sm",
 }
 
-app.layout = dmc.MantineProvider(
-    theme=mantine_theme,
-    children=dbc.Container(
+
+def _build_layout():
+    # Dash accepts a callable layout; deferring the component tree keeps
+    # module import cheap and re-evaluates only on first request.
+    return dmc.MantineProvider(
+        theme=mantine_theme,
+        children=dbc.Container(
+            [
+                html.H2("🔎 Prompter for Reasoning Models", style={"color": "#2c3e50"}),
+                html.P(
+                    "Welcome to the 🏆 ultimate prompter solution for your coding projects. "
+                    "This interactive multi-tab application is designed to gather code snippets "
+                    "from your entire project, letting you quickly assemble an entire prompt. "
+                    "Use it to highlight relevant sections of your code to guide your reasoning model. "
+                    "Additional features are in the pipeline to enhance your developer experience. "
+                    "Whether you need debugging support, performance tuning, or code reviews, "
+                    "our prompter streamlines the process by consolidating your code context "
+                    "and problem statements all in one place. Stay tuned for more updates!"
+                ),
+                dbc.Card(
+                    [
+                        dbc.CardHeader(
+                            "Select Project Folder",
+                            style={"backgroundColor": "#eaf2f8"},
+                        ),
+                        dbc.CardBody(
+                            [
+                                dbc.Label("Folder Path"),
+                                dbc.Input(
+                                    id="folder-path",
+                                    type="text",
+                                    placeholder="Enter path to your folder",
+                                    debounce=300,
+                                ),
+                            ]
+                        ),
+                    ],
+                    style={
+                        "marginTop": "25px",
+                        "border": "none",
+                        "boxShadow": "0 1px 2px 0 rgba(0,0,0,0.2)",
+                    },
+                ),
+                dbc.Card(
+                    [
+                        dbc.CardBody(
+                            [
+                                dbc.Tabs(
+                                    [
+                                        dbc.Tab(
+                                            label="Prompter",
+                                            children=[
+                                                html.Br(),
+                                                html.P(
+                                                    "This tab is your main interface to gather and assemble code from the specified "
+                                                    "folder or directory. You can select which files to include, preview your choices, "
+                                                    "and generate a complete prompt. Perfect for debugging sessions, code reviews, or "
+                                                    "any scenario needing a thorough code context for your reasoning model. "
+                                                    "Just point to your folder, pick file extensions, and you're ready to go! 🚀"
+                                                ),
+                                                dbc.Card(
+                                                    [
+                                                        dbc.CardHeader(
+                                                            "🛠️ Configuration",
+                                                            style={
+                                                                "backgroundColor": "#eaf2f8"
+                                                            },
+                                                        ),
+                                                        dbc.CardBody(
+                                                            [
+                                                                dbc.Row(
+                                                                    [
+                                                                        dbc.Col(
+                                                                            [
+                                                                                html.H5(
+                                                                                    "Configuration"
+                                                                                ),
+                                                                                dbc.Label(
+                                                                                    "Extension Preset"
+                                                                                ),
+                                                                                dcc.Dropdown(
+                                                                                    id="extension-preset",
+                                                                                    options=_EXTENSION_OPTIONS,
+                                                                                    value="None",
+                                                                                ),
+                                                                                html.Br(),
+                                                                                dbc.Label(
+                                                                                    "File Extensions"
+                                                                                ),
+                                                                                dbc.Input(
+                                                                                    id="file-extensions",
+                                                                                    type="text",
+                                                                                    placeholder=".py, .js, .ts",
+                                                                                    debounce=300,
+                                                                                ),
+                                                                                html.Br(),
+                                                                                dbc.Label(
+                                                                                    "Current Exclusion List"
+                                                                                ),
+                                                                                dbc.Input(
+                                                                                    id="exclusions-field",
+                                                                                    type="text",
+                                                                                    placeholder=".git, .gitignore, .pycache",
+                                                                                    debounce=300,
+                                                                                ),
+                                                                                html.Br(),
+                                                                                dbc.Label(
+                                                                                    "Prompt Template (Optional)"
+                                                                                ),
+                                                                                dcc.Dropdown(
+                                                                                    id="prompt-template",
+                                                                                    options=_PROMPT_OPTIONS,
+                                                                                    value="None (No Template)",
+                                                                                ),
+                                                                                html.Br(),
+                                                                                dbc.Alert(
+                                                                                    id="alert-no-files",
+                                                                                    color="danger",
+                                                                                    is_open=False,
+                                                                                ),
+                                                                            ],
+                                                                            md=4,
+                                                                        ),
+                                                                        dbc.Col(
+                                                                            [
+                                                                                html.H5(
+                                                                                    "File/Folder Tree"
+                                                                                ),
+                                                                                dbc.Alert(
+                                                                                    "Enter a valid folder path to see contents.",
+                                                                                    id="folder-warning",
+                                                                                    color="warning",
+                                                                                    is_open=True,
+                                                                                ),
+                                                                                html.Div(
+                                                                                    id="selected-count",
+                                                                                    children="0 file(s) selected",
+                                                                                    style={
+                                                                                        "marginTop": "15px"
+                                                                                    },
+                                                                                ),
+                                                                                html.Div(
+                                                                                    id="filetree_div"
+                                                                                ),
+                                                                                dcc.Store(
+                                                                                    id="tree-index-store",
+                                                                                    data={},
+                                                                                ),
+                                                                            ],
+                                                                            md=8,
+                                                                        ),
+                                                                    ],
+                                                                    style={
+                                                                        "marginTop": "25px"
+                                                                    },
+                                                                ),
+                                                            ]
+                                                        ),
+                                                    ],
+                                                    style={
+                                                        "marginTop": "25px",
+                                                        "border": "none",
+                                                        "boxShadow": "0 1px 2px 0 rgba(0,0,0,0.2)",
+                                                    },
+                                                ),
+                                                dbc.Card(
+                                                    [
+                                                        dbc.CardHeader(
+                                                            "✏️ Prompt Generation",
+                                                            style={
+                                                                "backgroundColor": "#fcf0e6"
+                                                            },
+                                                        ),
+                                                        dbc.CardBody(
+                                                            [
+                                                                dmc.Paper(
+                                                                    p="md",
+                                                                    style={
+                                                                        "marginTop": "30px"
+                                                                    },
+                                                                    children=[
+                                                                        dbc.Row(
+                                                                            [
+                                                                                dbc.Col(
+                                                                                    [
+                                                                                        html.H4(
+                                                                                            "Describe Your Task or Question"
+                                                                                        ),
+                                                                                        dcc.Textarea(
+                                                                                            id="problem-description",
+                                                                                            style={
+                                                                                                "width": "100%",
+                                                                                                "height": "200px",
+                                                                                            },
+                                                                                        ),
+                                                                                    ],
+                                                                                    md=6,
+                                                                                ),
+                                                                                dbc.Col(
+                                                                                    [
+                                                                                        html.H4(
+                                                                                            "Additional Information"
+                                                                                        ),
+                                                                                        dcc.Textarea(
+                                                                                            id="additional-info",
+                                                                                            style={
+                                                                                                "width": "100%",
+                                                                                                "height": "200px",
+                                                                                            },
+                                                                                        ),
+                                                                                    ],
+                                                                                    md=6,
+                                                                                ),
+                                                                            ]
+                                                                        ),
+                                                                        html.Br(),
+                                                                        dbc.Row(
+                                                                            [
+                                                                                dbc.Col(
+                                                                                    [
+                                                                                        html.H4(
+                                                                                            "Constraints / Warnings"
+                                                                                        ),
+                                                                                        dcc.Textarea(
+                                                                                            id="constraints-warnings",
+                                                                                            style={
+                                                                                                "width": "100%",
+                                                                                                "height": "200px",
+                                                                                            },
+                                                                                        ),
+                                                                                    ],
+                                                                                    md=6,
+                                                                                ),
+                                                                                dbc.Col(
+                                                                                    [
+                                                                                        html.H4(
+                                                                                            "Output Format"
+                                                                                        ),
+                                                                                        dcc.Textarea(
+                                                                                            id="output-format",
+                                                                                            style={
+                                                                                                "width": "100%",
+                                                                                                "height": "200px",
+                                                                                            },
+                                                                                            value='file: path/to/file.ext\n--- START CODE ---\n<entire new content for that file>\n--- END CODE ---\n\nRepeat the above block for each file changed.\n\nExample:\nfile: src/main.py\n--- START CODE ---\ndef my_function():\n    print("Hello World!")\n--- END CODE ---\n\nfile: requirements.txt\n--- START CODE ---\nrequests==2.25.1\nnumpy==1.20.0\n--- END CODE ---',
+                                                                                        ),
+                                                                                    ],
+                                                                                    md=6,
+                                                                                ),
+                                                                            ]
+                                                                        ),
+                                                                        html.Br(),
+                                                                        dbc.Row(
+                                                                            [
+                                                                                dbc.Col(
+                                                                                    [
+                                                                                        dbc.Button(
+                                                                                            "Generate Prompt",
+                                                                                            id="generate-button",
+                                                                                            color="primary",
+                                                                                            style={
+                                                                                                "margin-right": "10px"
+                                                                                            },
+                                                                                        ),
+                                                                                        dbc.Button(
+                                                                                            "Copy Prompt",
+                                                                                            id="copy-prompt-btn",
+                                                                                            color="secondary",
+                                                                                            style={
+                                                                                                "margin-right": "10px"
+                                                                                            },
+                                                                                        ),
+                                                                                        html.Span(
+                                                                                            dbc.Button(
+                                                                                                "Download Prompt",
+                                                                                                id="download-btn",
+                                                                                                download="reasoning_prompt.txt",
+                                                                                                external_link=True,
+                                                                                                color="secondary",
+                                                                                                style={
+                                                                                                    "display": "none"
+                                                                                                },
+                                                                                            ),
+                                                                                            id="download-link-container",
+                                                                                            style={
+                                                                                                "marginLeft": "10px"
+                                                                                            },
+                                                                                        ),
+                                                                                    ],
+                                                                                    width=12,
+                                                                                ),
+                                                                            ]
+                                                                        ),
+                                                                        html.Br(),
+                                                                        dbc.Row(
+                                                                            [
+                                                                                dbc.Col(
+                                                                                    [
+                                                                                        html.H4(
+                                                                                            "Generated Prompt"
+                                                                                        ),
+                                                                                        dcc.Textarea(
+                                                                                            id="final-prompt-output",
+                                                                                            style={
+                                                                                                "width": "100%",
+                                                                                                "height": "300px",
+                                                                                            },
+                                                                                            readOnly=False,
+                                                                                        ),
+                                                                                        dcc.Store(
+                                                                                            id="dummy-store",
+                                                                                            data="",
+                                                                                        ),
+                                                                                    ],
+                                                                                    width=12,
+                                                                                ),
+                                                                            ]
+                                                                        ),
+                                                                    ],
+                                                                ),
+                                                            ]
+                                                        ),
+                                                    ],
+                                                    style={
+                                                        "marginTop": "25px",
+                                                        "border": "none",
+                                                        "boxShadow": "0 1px 2px 0 rgba(0,0,0,0.2)",
+                                                    },
+                                                ),
+                                            ],
+                                        ),
+                                        dbc.Tab(
+                                            label="Apply LLM Updates",
+                                            children=[
+                                                html.Br(),
+                                                html.H4("Paste LLM Response Below"),
+                                                dbc.Textarea(
+                                                    id="llm-response-input",
+                                                    style={
+                                                        "width": "100%",
+                                                        "height": "200px",
+                                                    },
+                                                    placeholder="Paste LLM's updated code blocks here (following the specified format)",
+                                                ),
+                                                html.Br(),
+                                                dbc.Button(
+                                                    "Generate Diffs",
+                                                    id="generate-diffs-btn",
+                                                    color="primary",
+                                                ),
+                                                html.Br(),
+                                                html.Br(),
+                                                dbc.Alert(
+                                                    id="apply-feedback",
+                                                    color="info",
+                                                    is_open=False,
+                                                ),
+                                                dcc.Store(
+                                                    id="parsed-changes-store", data=[]
+                                                ),
+                                                dcc.Store(id="backups-store", data=[]),
+                                                html.Div(id="diffs-output"),
+                                                html.Br(),
+                                                dbc.Button(
+                                                    "Apply Changes",
+                                                    id="apply-changes-btn",
+                                                    color="danger",
+                                                ),
+                                                html.Br(),
+                                                html.Br(),
+                                                html.Hr(),
+                                                html.H5("Restore from Backup"),
+                                                dcc.Dropdown(
+                                                    id="backup-select-dropdown",
+                                                    placeholder="Select a file to restore...",
+                                                    options=[],
+                                                    value=None,
+                                                    style={"width": "300px"},
+                                                ),
+                                                html.Br(),
+                                                dbc.Button(
+                                                    "Restore Selected Backup",
+                                                    id="restore-backup-btn",
+                                                    color="secondary",
+                                                ),
+                                                html.Br(),
+                                                html.Br(),
+                                            ],
+                                        ),
+                                    ]
+                                )
+                            ]
+                        )
+                    ],
+                    style={
+                        "marginTop": "25px",
+                        "border": "none",
+                        "boxShadow": "0 1px 2px 0 rgba(0,0,0,0.2)",
+                    },
+                ),
+            ],
+            fluid=True,
+        ),
+    )
+
+
+app.layout = _build_layout
+
+
+# Pointing the app at a huge folder (a home directory, an unexcluded
+# node_modules) must not stall the server building components forever; the
+# tree walk stops after this many rendered entries and says so.
+_MAX_TREE_ENTRIES = 5000
+
+
+# Node factories live at module level with a shared constant style dict, so
+# building a large tree pays neither per-node bound-method/self lookups nor a
+# fresh style dict per component.
+_FILE_NODE_STYLE = {"paddingTop": "5px", "marginLeft": "15px"}
+
+
+def _file_node(path: str, name: str) -> dmc.Group:
+    return dmc.Group(
         [
-            html.H2("🔎 Prompter for Reasoning Models", style={"color": "#2c3e50"}),
-            html.P(
-                "Welcome to the 🏆 ultimate prompter solution for your coding projects. "
-                "This interactive multi-tab application is designed to gather code snippets "
-                "from your entire project, letting you quickly assemble an entire prompt. "
-                "Use it to highlight relevant sections of your code to guide your reasoning model. "
-                "Additional features are in the pipeline to enhance your developer experience. "
-                "Whether you need debugging support, performance tuning, or code reviews, "
-                "our prompter streamlines the process by consolidating your code context "
-                "and problem statements all in one place. Stay tuned for more updates!"
-            ),
-            dbc.Card(
-                [
-                    dbc.CardHeader(
-                        "Select Project Folder", style={"backgroundColor": "#eaf2f8"}
-                    ),
-                    dbc.CardBody(
-                        [
-                            dbc.Label("Folder Path"),
-                            dbc.Input(
-                                id="folder-path",
-                                type="text",
-                                placeholder="Enter path to your folder",
-                            ),
-                        ]
-                    ),
-                ],
-                style={
-                    "marginTop": "25px",
-                    "border": "none",
-                    "boxShadow": "0 1px 2px 0 rgba(0,0,0,0.2)",
-                },
-            ),
-            dbc.Card(
-                [
-                    dbc.CardBody(
-                        [
-                            dbc.Tabs(
-                                [
-                                    dbc.Tab(
-                                        label="Prompter",
-                                        children=[
-                                            html.Br(),
-                                            html.P(
-                                                "This tab is your main interface to gather and assemble code from the specified "
-                                                "folder or directory. You can select which files to include, preview your choices, "
-                                                "and generate a complete prompt. Perfect for debugging sessions, code reviews, or "
-                                                "any scenario needing a thorough code context for your reasoning model. "
-                                                "Just point to your folder, pick file extensions, and you're ready to go! 🚀"
-                                            ),
-                                            dbc.Card(
-                                                [
-                                                    dbc.CardHeader(
-                                                        "🛠️ Configuration",
-                                                        style={
-                                                            "backgroundColor": "#eaf2f8"
-                                                        },
-                                                    ),
-                                                    dbc.CardBody(
-                                                        [
-                                                            dbc.Row(
-                                                                [
-                                                                    dbc.Col(
-                                                                        [
-                                                                            html.H5(
-                                                                                "Configuration"
-                                                                            ),
-                                                                            dbc.Label(
-                                                                                "Extension Preset"
-                                                                            ),
-                                                                            dcc.Dropdown(
-                                                                                id="extension-preset",
-                                                                                options=[
-                                                                                    {
-                                                                                        "label": k,
-                                                                                        "value": k,
-                                                                                    }
-                                                                                    for k in sorted(
-                                                                                        EXTENSION_PRESETS.keys()
-                                                                                    )
-                                                                                ],
-                                                                                value="None",
-                                                                            ),
-                                                                            html.Br(),
-                                                                            dbc.Label(
-                                                                                "File Extensions"
-                                                                            ),
-                                                                            dbc.Input(
-                                                                                id="file-extensions",
-                                                                                type="text",
-                                                                                placeholder=".py, .js, .ts",
-                                                                            ),
-                                                                            html.Br(),
-                                                                            dbc.Label(
-                                                                                "Current Exclusion List"
-                                                                            ),
-                                                                            dbc.Input(
-                                                                                id="exclusions-field",
-                                                                                type="text",
-                                                                                placeholder=".git, .gitignore, .pycache",
-                                                                            ),
-                                                                            html.Br(),
-                                                                            dbc.Label(
-                                                                                "Prompt Template (Optional)"
-                                                                            ),
-                                                                            dcc.Dropdown(
-                                                                                id="prompt-template",
-                                                                                options=[
-                                                                                    {
-                                                                                        "label": k,
-                                                                                        "value": k,
-                                                                                    }
-                                                                                    for k in sorted(
-                                                                                        PROMPT_LIBRARY.keys()
-                                                                                    )
-                                                                                ],
-                                                                                value="None (No Template)",
-                                                                            ),
-                                                                            html.Br(),
-                                                                            dbc.Alert(
-                                                                                id="alert-no-files",
-                                                                                color="danger",
-                                                                                is_open=False,
-                                                                            ),
-                                                                        ],
-                                                                        md=4,
-                                                                    ),
-                                                                    dbc.Col(
-                                                                        [
-                                                                            html.H5(
-                                                                                "File/Folder Tree"
-                                                                            ),
-                                                                            dbc.Alert(
-                                                                                "Enter a valid folder path to see contents.",
-                                                                                id="folder-warning",
-                                                                                color="warning",
-                                                                                is_open=True,
-                                                                            ),
-                                                                            html.Div(
-                                                                                id="selected-count",
-                                                                                children="0 file(s) selected",
-                                                                                style={
-                                                                                    "marginTop": "15px"
-                                                                                },
-                                                                            ),
-                                                                            html.Div(
-                                                                                id="filetree_div"
-                                                                            ),
-                                                                        ],
-                                                                        md=8,
-                                                                    ),
-                                                                ],
-                                                                style={
-                                                                    "marginTop": "25px"
-                                                                },
-                                                            ),
-                                                        ]
-                                                    ),
-                                                ],
-                                                style={
-                                                    "marginTop": "25px",
-                                                    "border": "none",
-                                                    "boxShadow": "0 1px 2px 0 rgba(0,0,0,0.2)",
-                                                },
-                                            ),
-                                            dbc.Card(
-                                                [
-                                                    dbc.CardHeader(
-                                                        "✏️ Prompt Generation",
-                                                        style={
-                                                            "backgroundColor": "#fcf0e6"
-                                                        },
-                                                    ),
-                                                    dbc.CardBody(
-                                                        [
-                                                            dmc.Paper(
-                                                                p="md",
-                                                                style={
-                                                                    "marginTop": "30px"
-                                                                },
-                                                                children=[
-                                                                    dbc.Row(
-                                                                        [
-                                                                            dbc.Col(
-                                                                                [
-                                                                                    html.H4(
-                                                                                        "Describe Your Task or Question"
-                                                                                    ),
-                                                                                    dcc.Textarea(
-                                                                                        id="problem-description",
-                                                                                        style={
-                                                                                            "width": "100%",
-                                                                                            "height": "200px",
-                                                                                        },
-                                                                                    ),
-                                                                                ],
-                                                                                md=6,
-                                                                            ),
-                                                                            dbc.Col(
-                                                                                [
-                                                                                    html.H4(
-                                                                                        "Additional Information"
-                                                                                    ),
-                                                                                    dcc.Textarea(
-                                                                                        id="additional-info",
-                                                                                        style={
-                                                                                            "width": "100%",
-                                                                                            "height": "200px",
-                                                                                        },
-                                                                                    ),
-                                                                                ],
-                                                                                md=6,
-                                                                            ),
-                                                                        ]
-                                                                    ),
-                                                                    html.Br(),
-                                                                    dbc.Row(
-                                                                        [
-                                                                            dbc.Col(
-                                                                                [
-                                                                                    html.H4(
-                                                                                        "Constraints / Warnings"
-                                                                                    ),
-                                                                                    dcc.Textarea(
-                                                                                        id="constraints-warnings",
-                                                                                        style={
-                                                                                            "width": "100%",
-                                                                                            "height": "200px",
-                                                                                        },
-                                                                                    ),
-                                                                                ],
-                                                                                md=6,
-                                                                            ),
-                                                                            dbc.Col(
-                                                                                [
-                                                                                    html.H4(
-                                                                                        "Output Format"
-                                                                                    ),
-                                                                                    dcc.Textarea(
-                                                                                        id="output-format",
-                                                                                        style={
-                                                                                            "width": "100%",
-                                                                                            "height": "200px",
-                                                                                        },
-                                                                                        value='file: path/to/file.ext\n--- START CODE ---\n<entire new content for that file>\n--- END CODE ---\n\nRepeat the above block for each file changed.\n\nExample:\nfile: src/main.py\n--- START CODE ---\ndef my_function():\n    print("Hello World!")\n--- END CODE ---\n\nfile: requirements.txt\n--- START CODE ---\nrequests==2.25.1\nnumpy==1.20.0\n--- END CODE ---',
-                                                                                    ),
-                                                                                ],
-                                                                                md=6,
-                                                                            ),
-                                                                        ]
-                                                                    ),
-                                                                    html.Br(),
-                                                                    dbc.Row(
-                                                                        [
-                                                                            dbc.Col(
-                                                                                [
-                                                                                    dbc.Button(
-                                                                                        "Generate Prompt",
-                                                                                        id="generate-button",
-                                                                                        color="primary",
-                                                                                        style={
-                                                                                            "margin-right": "10px"
-                                                                                        },
-                                                                                    ),
-                                                                                    dbc.Button(
-                                                                                        "Copy Prompt",
-                                                                                        id="copy-prompt-btn",
-                                                                                        color="secondary",
-                                                                                        style={
-                                                                                            "margin-right": "10px"
-                                                                                        },
-                                                                                    ),
-                                                                                    html.Span(
-                                                                                        id="download-link-container",
-                                                                                        style={
-                                                                                            "marginLeft": "10px"
-                                                                                        },
-                                                                                    ),
-                                                                                ],
-                                                                                width=12,
-                                                                            ),
-                                                                        ]
-                                                                    ),
-                                                                    html.Br(),
-                                                                    dbc.Row(
-                                                                        [
-                                                                            dbc.Col(
-                                                                                [
-                                                                                    html.H4(
-                                                                                        "Generated Prompt"
-                                                                                    ),
-                                                                                    dcc.Textarea(
-                                                                                        id="final-prompt-output",
-                                                                                        style={
-                                                                                            "width": "100%",
-                                                                                            "height": "300px",
-                                                                                        },
-                                                                                        readOnly=False,
-                                                                                    ),
-                                                                                    dcc.Store(
-                                                                                        id="dummy-store",
-                                                                                        data="",
-                                                                                    ),
-                                                                                ],
-                                                                                width=12,
-                                                                            ),
-                                                                        ]
-                                                                    ),
-                                                                ],
-                                                            ),
-                                                        ]
-                                                    ),
-                                                ],
-                                                style={
-                                                    "marginTop": "25px",
-                                                    "border": "none",
-                                                    "boxShadow": "0 1px 2px 0 rgba(0,0,0,0.2)",
-                                                },
-                                            ),
-                                        ],
-                                    ),
-                                    dbc.Tab(
-                                        label="Apply LLM Updates",
-                                        children=[
-                                            html.Br(),
-                                            html.H4("Paste LLM Response Below"),
-                                            dbc.Textarea(
-                                                id="llm-response-input",
-                                                style={
-                                                    "width": "100%",
-                                                    "height": "200px",
-                                                },
-                                                placeholder="Paste LLM's updated code blocks here (following the specified format)",
-                                            ),
-                                            html.Br(),
-                                            dbc.Button(
-                                                "Generate Diffs",
-                                                id="generate-diffs-btn",
-                                                color="primary",
-                                            ),
-                                            html.Br(),
-                                            html.Br(),
-                                            dbc.Alert(
-                                                id="apply-feedback",
-                                                color="info",
-                                                is_open=False,
-                                            ),
-                                            dcc.Store(
-                                                id="parsed-changes-store", data=[]
-                                            ),
-                                            dcc.Store(id="backups-store", data=[]),
-                                            html.Div(id="diffs-output"),
-                                            html.Br(),
-                                            dbc.Button(
-                                                "Apply Changes",
-                                                id="apply-changes-btn",
-                                                color="danger",
-                                            ),
-                                            html.Br(),
-                                            html.Br(),
-                                            html.Hr(),
-                                            html.H5("Restore from Backup"),
-                                            dcc.Dropdown(
-                                                id="backup-select-dropdown",
-                                                placeholder="Select a file to restore...",
-                                                options=[],
-                                                value=None,
-                                                style={"width": "300px"},
-                                            ),
-                                            html.Br(),
-                                            dbc.Button(
-                                                "Restore Selected Backup",
-                                                id="restore-backup-btn",
-                                                color="secondary",
-                                            ),
-                                            html.Br(),
-                                            html.Br(),
-                                        ],
-                                    ),
-                                ]
-                            )
-                        ]
-                    )
-                ],
-                style={
-                    "marginTop": "25px",
-                    "border": "none",
-                    "boxShadow": "0 1px 2px 0 rgba(0,0,0,0.2)",
-                },
+            dmc.Checkbox(
+                id={"type": "file_checkbox", "index": path},
+                size="sm",
+                checked=True,
             ),
+            DashIconify(icon="akar-icons:file", width=18),
+            dmc.Text(name, size="sm"),
         ],
-        fluid=True,
-    ),
-)
+        gap=5,
+        align="center",
+        wrap="nowrap",
+        style=_FILE_NODE_STYLE,
+    )
+
+
+def _folder_row(path: str, name: str) -> dmc.Group:
+    folder_checkbox = dmc.Checkbox(
+        id={"type": "folder_checkbox", "index": path},
+        size="sm",
+        checked=True,
+    )
+    folder_icon = DashIconify(icon="akar-icons:folder", width=18)
+    folder_name = dmc.Text(name, size="sm")
+    folder_control = dmc.AccordionControl(
+        dmc.Group([folder_icon, folder_name], gap=5, align="center", wrap="nowrap")
+    )
+    return dmc.Group(
+        [folder_checkbox, folder_control], gap=10, align="center", wrap="nowrap"
+    )
 
 
 class FileTree:
@@ -668,66 +1031,113 @@ class FileTree:
 
     def __init__(self, filepath: Path, exclusions: List[str], extensions: List[str]):
         self.filepath = filepath
-        self.exclusions = exclusions
+        # Held as a tuple so every is_hidden_or_excluded call reuses the
+        # same hashable key into the compiled-exclusion cache.
+        self.exclusions = tuple(exclusions)
         self.extensions = extensions
+        self._ext_tuple = tuple(e.lower() for e in extensions)
         self.folders_expanded = []
-
-    def flatten(self, input_list):
-        return [item for sublist in input_list for item in sublist]
-
-    def build_file(self, file_path: Path):
-        return dmc.Group(
-            [
-                dmc.Checkbox(
-                    id={"type": "file_checkbox", "index": str(file_path)},
-                    size="sm",
-                    checked=True,
-                ),
-                DashIconify(icon="akar-icons:file", width=18),
-                dmc.Text(file_path.name, size="sm"),
-            ],
-            gap=5,
-            align="center",
-            wrap="nowrap",
-            style={"paddingTop": "5px", "marginLeft": "15px"},
-        )
-
-    def build_folder_row(self, folder_path: Path):
-        folder_checkbox = dmc.Checkbox(
-            id={"type": "folder_checkbox", "index": str(folder_path)},
-            size="sm",
-            checked=True,
-        )
-        folder_icon = DashIconify(icon="akar-icons:folder", width=18)
-        folder_name = dmc.Text(folder_path.name, size="sm")
-        folder_control = dmc.AccordionControl(
-            dmc.Group([folder_icon, folder_name], gap=5, align="center", wrap="nowrap")
-        )
-        return dmc.Group(
-            [folder_checkbox, folder_control], gap=10, align="center", wrap="nowrap"
+        # folder path -> descendant folder/file paths, built during the walk
+        # so the toggle callback can resolve a click with dict lookups
+        # instead of re-walking the tree.
+        self.folder_index = {}
+        # file path -> path relative to the tree root, so callbacks don't
+        # recompute os.path.relpath per file.
+        self.rel_by_file = {}
+        self._root_str = str(filepath)
+        self._root_prefix = self._root_str.rstrip(os.sep) + os.sep
+        # Set when the walk hits _MAX_TREE_ENTRIES and stops early.
+        self.truncated = False
+
+    def _collect_file(self, file_path: str, folders: tuple):
+        # Walked paths always extend the root, so a prefix slice replaces
+        # os.path.relpath's per-file normalization.
+        if file_path.startswith(self._root_prefix):
+            rel = file_path[len(self._root_prefix) :]
+        else:
+            rel = os.path.relpath(file_path, self._root_str)
+        self.rel_by_file[file_path] = rel
+        for folder in folders:
+            self.folder_index[folder]["files"].append(file_path)
+
+    def _register_folder(self, path: str, ancestors: tuple):
+        self.folders_expanded.append(path)
+        self.folder_index[path] = {"folders": [path], "files": []}
+        for ancestor in ancestors:
+            self.folder_index[ancestor]["folders"].append(path)
+
+    def _folder_item(self, path: str, name: str):
+        # The panel's children list is filled in after construction, which
+        # lets the iterative walk place each AccordionItem in sorted order
+        # among its siblings before its own contents are scanned.
+        children = []
+        item = dmc.AccordionItem(
+            [_folder_row(path, name), dmc.AccordionPanel(children=children)],
+            value=path,
         )
+        return item, children
 
-    def build_tree(self, path: Path):
-        if is_hidden_or_excluded(str(path), self.exclusions):
+    def build_tree(self, path: str):
+        if is_hidden_or_excluded(path, self.exclusions):
             return []
-        if path.is_file():
-            if any(path.name.lower().endswith(ext) for ext in self.extensions):
-                return [self.build_file(path)]
-            else:
-                return []
-        self.folders_expanded.append(str(path))
-
-        items = sorted(list(path.iterdir()), key=lambda x: x.name)
-        children = self.flatten([self.build_tree(child) for child in items])
-        folder_row = self.build_folder_row(path)
-        return [
-            dmc.AccordionItem(
-                [folder_row, dmc.AccordionPanel(children=children)], value=str(path)
-            )
-        ]
+        name = os.path.basename(path.rstrip(os.sep)) or path
+        if os.path.isfile(path):
+            if name.lower().endswith(self._ext_tuple):
+                self._collect_file(path, ())
+                return [_file_node(path, name)]
+            return []
+        return self._build_folder(path, name)
+
+    def _build_folder(self, path: str, name: str):
+        # Iterative walk with an explicit queue: no recursion limit on deep
+        # trees and no intermediate list-of-lists flattening per level. Each
+        # folder owns exactly one children list, appended to in place.
+        self._register_folder(path, ())
+        root_item, root_children = self._folder_item(path, name)
+        pending = deque([(path, (path,), root_children)])
+        # Hoist hot attribute lookups out of the per-entry loop; on a
+        # 10k-node tree these are taken once per node otherwise.
+        exclusions = self.exclusions
+        ext_tuple = self._ext_tuple
+        register_folder = self._register_folder
+        folder_item = self._folder_item
+        collect_file = self._collect_file
+        budget = _MAX_TREE_ENTRIES
+        while pending:
+            if budget <= 0:
+                self.truncated = True
+                break
+            folder, lineage, children = pending.popleft()
+            # One scandir pass: the directory entry carries the file type,
+            # so no per-child stat and no per-child Path construction.
+            try:
+                with os.scandir(folder) as entries:
+                    sorted_entries = sorted(entries, key=lambda e: e.name)
+            except OSError:
+                continue
+            append_child = children.append
+            for entry in sorted_entries:
+                if budget <= 0:
+                    self.truncated = True
+                    break
+                if _is_excluded_name(entry.name, exclusions):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    register_folder(entry.path, lineage)
+                    sub_item, sub_children = folder_item(entry.path, entry.name)
+                    append_child(sub_item)
+                    pending.append((entry.path, lineage + (entry.path,), sub_children))
+                    budget -= 1
+                elif entry.is_file(
+                    follow_symlinks=False
+                ) and entry.name.lower().endswith(ext_tuple):
+                    collect_file(entry.path, lineage)
+                    append_child(_file_node(entry.path, entry.name))
+                    budget -= 1
+        return [root_item]
 
     def render(self) -> dmc.Accordion:
-        tree_items = self.build_tree(self.filepath)
+        tree_items = self.build_tree(str(self.filepath))
         return dmc.Accordion(
             children=tree_items,
             multiple=True,
@@ -745,20 +1155,42 @@ class FileTree:
 def sync_fields_with_preset(preset_label):
     if preset_label not in EXTENSION_PRESETS:
         preset_label = "None"
-    preset_extensions = EXTENSION_PRESETS[preset_label]
-    base_exclusion_set = set(BASE_EXCLUSIONS)
-    if preset_label in PRESET_EXCLUSION_MAP:
-        base_exclusion_set = base_exclusion_set.union(
-            PRESET_EXCLUSION_MAP[preset_label]
-        )
+    return EXTENSION_PRESETS[preset_label], _PRESET_EXCL_TEXT[preset_label]
 
-    excl_text = ", ".join(sorted(list(base_exclusion_set)))
-    return preset_extensions, excl_text
+
+@functools.lru_cache(maxsize=32)
+def _render_tree(folder_path: str, ext_tuple: tuple, excl_tuple: tuple, mtime_ns: int):
+    """
+    Memoized tree render. The folder's mtime is part of the key, so repeat
+    callbacks with unchanged inputs skip the walk and the component build
+    while edits to the folder still invalidate stale entries.
+    """
+    tree_obj = FileTree(
+        filepath=Path(folder_path),
+        exclusions=list(excl_tuple),
+        extensions=list(ext_tuple),
+    )
+    rendered = tree_obj.render()
+    if tree_obj.truncated:
+        rendered = html.Div(
+            [
+                dbc.Alert(
+                    f"Showing the first {_MAX_TREE_ENTRIES} entries only — "
+                    "narrow the extension filter or add exclusions to see "
+                    "the rest.",
+                    color="warning",
+                ),
+                rendered,
+            ]
+        )
+    index = {"folders": tree_obj.folder_index, "rel_by_file": tree_obj.rel_by_file}
+    return rendered, index
 
 
 @app.callback(
     Output("folder-warning", "is_open"),
     Output("filetree_div", "children"),
+    Output("tree-index-store", "data"),
     Input("folder-path", "value"),
     Input("file-extensions", "value"),
     Input("exclusions-field", "value"),
@@ -766,126 +1198,100 @@ def sync_fields_with_preset(preset_label):
 )
 def update_file_tree(folder_path, file_ext_string, exclusion_string):
     if not folder_path or not os.path.isdir(folder_path):
-        return True, ""
-
-    extensions = []
-    for ext in file_ext_string.split(","):
-        e = ext.strip().lower()
-        if e and not e.startswith("."):
-            e = "." + e
-        if e:
-            extensions.append(e)
-
-    user_excl_clean = set()
-    if exclusion_string.strip():
-        for x in exclusion_string.split(","):
-            x2 = x.strip()
-            if x2:
-                user_excl_clean.add(x2)
+        return True, "", {}
 
-    tree_obj = FileTree(
-        filepath=Path(folder_path),
-        exclusions=sorted(list(user_excl_clean)),
-        extensions=extensions,
+    # A leading "./" in the typed path would otherwise trip the hidden-path
+    # check and silently yield an empty tree; normalize it away up front.
+    folder_path = os.path.normpath(folder_path)
+    try:
+        mtime_ns = os.stat(folder_path).st_mtime_ns
+    except OSError:
+        return True, "", {}
+    # Debounced inputs can still re-fire with identical values; _render_tree's
+    # lru_cache already makes those repeat renders cheap, and re-sending the
+    # tree is always correct per client — a shared no_update fast path is not.
+    tree, folder_index = _render_tree(
+        folder_path,
+        _parse_extension_field(file_ext_string),
+        _parse_exclusion_field(exclusion_string),
+        mtime_ns,
     )
-    return False, tree_obj.render()
+    return False, tree, folder_index
 
 
-@app.callback(
+# Propagating a folder toggle to its descendants is dict lookups over the
+# tree index the render already shipped to the browser, so run it clientside:
+# no round-trip and no server work per click. The callback context names
+# exactly the folders that changed; applying their values is idempotent.
+app.clientside_callback(
+    """
+    function(folder_check_values, folder_ids, file_ids, file_check_values, tree_index) {
+        var ctx = dash_clientside.callback_context;
+        var triggered = (ctx && ctx.triggered) || [];
+        var folderMap = (tree_index && tree_index.folders) || {};
+        if (!triggered.length || !Object.keys(folderMap).length) {
+            return [dash_clientside.no_update, dash_clientside.no_update];
+        }
+        var folderPos = {}, filePos = {};
+        for (var i = 0; i < folder_ids.length; i++) {
+            folderPos[folder_ids[i].index] = i;
+        }
+        for (var j = 0; j < file_ids.length; j++) {
+            filePos[file_ids[j].index] = j;
+        }
+        var newFiles = (file_check_values || []).slice();
+        var newFolders = (folder_check_values || []).slice();
+        for (var t = 0; t < triggered.length; t++) {
+            var propId = triggered[t].prop_id;
+            var folder;
+            try {
+                folder = JSON.parse(propId.slice(0, propId.lastIndexOf("."))).index;
+            } catch (e) {
+                continue;
+            }
+            var entry = folderMap[folder];
+            if (!entry) continue;
+            var val = triggered[t].value;
+            (entry.folders || []).forEach(function(sub) {
+                var p = folderPos[sub];
+                if (p !== undefined) newFolders[p] = val;
+            });
+            (entry.files || []).forEach(function(sub) {
+                var p = filePos[sub];
+                if (p !== undefined) newFiles[p] = val;
+            });
+        }
+        return [newFiles, newFolders];
+    }
+    """,
     Output({"type": "file_checkbox", "index": ALL}, "checked"),
     Output({"type": "folder_checkbox", "index": ALL}, "checked"),
     Input({"type": "folder_checkbox", "index": ALL}, "checked"),
     State({"type": "folder_checkbox", "index": ALL}, "id"),
-    State({"type": "folder_checkbox", "index": ALL}, "checked"),
     State({"type": "file_checkbox", "index": ALL}, "id"),
     State({"type": "file_checkbox", "index": ALL}, "checked"),
-    State("folder-path", "value"),
-    State("file-extensions", "value"),
-    State("exclusions-field", "value"),
+    State("tree-index-store", "data"),
     prevent_initial_call=True,
 )
-def toggle_folder_files(
-    folder_check_values,
-    folder_ids,
-    old_folder_check_values,
-    file_ids,
-    file_check_values,
-    folder_path,
-    file_ext_string,
-    exclusion_string,
-):
-    if not folder_path or not os.path.isdir(folder_path):
-        return file_check_values, old_folder_check_values
-
-    def get_subfolders_abs(base_abs_path, exclusion_list, collected_abs):
-        for root, dirs, _files in os.walk(base_abs_path):
-            if is_hidden_or_excluded(root, exclusion_list):
-                dirs[:] = []
-                continue
-            for d in dirs:
-                full_dir = os.path.join(root, d)
-                if not is_hidden_or_excluded(full_dir, exclusion_list):
-                    collected_abs.add(os.path.abspath(full_dir))
-
-    extensions = []
-    for ext in file_ext_string.split(","):
-        e = ext.strip().lower()
-        if e and not e.startswith("."):
-            e = "." + e
-        if e:
-            extensions.append(e)
-
-    user_excl_clean = set()
-    if exclusion_string.strip():
-        for x in exclusion_string.split(","):
-            x2 = x.strip()
-            if x2:
-                user_excl_clean.add(x2)
-
-    new_file_states = list(file_check_values)
-    new_folder_states = list(old_folder_check_values)
-
-    for f_val, f_id in zip(folder_check_values, folder_ids):
-        folder_abs = os.path.abspath(f_id["index"])
-        all_subfolders_abs = set()
-        all_subfolders_abs.add(folder_abs)
-        get_subfolders_abs(folder_abs, list(user_excl_clean), all_subfolders_abs)
-
-        for idx, (fld_id, fld_state) in enumerate(zip(folder_ids, new_folder_states)):
-            if fld_id["index"]:
-                fld_abs = os.path.abspath(fld_id["index"])
-                if fld_abs in all_subfolders_abs:
-                    new_folder_states[idx] = f_val
-
-        subfiles = []
-        for subf in all_subfolders_abs:
-            add_all_files(
-                subf, folder_path, extensions, list(user_excl_clean), subfiles
-            )
-        for idx, (this_file_id, old_val_file) in enumerate(
-            zip(file_ids, new_file_states)
-        ):
-            if this_file_id["index"]:
-                rel_path = os.path.relpath(this_file_id["index"], folder_path)
-                if rel_path in subfiles:
-                    new_file_states[idx] = f_val
-
-    return new_file_states, new_folder_states
 
 
-@app.callback(
+# Counting checked boxes needs no server state, so keep it in the browser
+# and spare a network round-trip per checkbox click.
+app.clientside_callback(
+    """
+    function(file_check_values) {
+        var n = (file_check_values || []).filter(Boolean).length;
+        return n + " file(s) selected";
+    }
+    """,
     Output("selected-count", "children"),
     Input({"type": "file_checkbox", "index": ALL}, "checked"),
     prevent_initial_call=True,
 )
-def count_selected_files(file_check_values):
-    if not file_check_values:
-        return "0 file(s) selected"
-    return f"{sum(bool(v) for v in file_check_values)} file(s) selected"
 
 
 def generate_prompt(
-    source_files: List[Dict[str, str]],
+    source_files: Iterable[Tuple[str, str, str]],
     problem_description: str,
     constraints_warnings: str,
     output_format_text: str,
@@ -897,47 +1303,46 @@ def generate_prompt(
     # Problem Statement
     prob = problem_description.strip()
     if prob:
-        sections.append(
-            "##BEGIN-PROBLEM-STATEMENT\n" + prob + "\n##END-PROBLEM-STATEMENT"
-        )
+        sections.append(f"##BEGIN-PROBLEM-STATEMENT\n{prob}\n##END-PROBLEM-STATEMENT")
 
     # Constraints / Warnings
     cw = constraints_warnings.strip()
     if cw:
         sections.append(
-            "##BEGIN-CONSTRAINTS-WARNINGS\n" + cw + "\n##END-CONSTRAINTS-WARNINGS"
+            f"##BEGIN-CONSTRAINTS-WARNINGS\n{cw}\n##END-CONSTRAINTS-WARNINGS"
         )
 
     # Output Format
     ofmt = output_format_text.strip()
     if ofmt:
-        sections.append("##BEGIN-OUTPUT-FORMAT\n" + ofmt + "\n##END-OUTPUT-FORMAT")
-
-    # Relevant Code
-    code_section = ["##BEGIN-RELEVANT-CODE"]
-    for file_info in source_files:
-        language = get_language_extension(file_info["filename"])
+        sections.append(f"##BEGIN-OUTPUT-FORMAT\n{ofmt}\n##END-OUTPUT-FORMAT")
+
+    # Relevant Code: file bodies dominate the prompt size, so stream them
+    # into one buffer instead of accumulating intermediate strings.
+    buf = io.StringIO()
+    buf.write("##BEGIN-RELEVANT-CODE")
+    for filename, display_path, content in source_files:
+        language = get_language_extension(filename)
         if language:
-            code_block = f"```{language}\n{file_info['content']}\n```"
+            buf.write(
+                f"\n\n###BEGIN-FILE: {display_path}\n```{language}\n{content}\n```\n###END-FILE"
+            )
         else:
-            code_block = f"{file_info['content']}"
-        code_section.append(
-            f"###BEGIN-FILE: {file_info['display_path']}\n{code_block}\n###END-FILE"
-        )
-    code_section.append("##END-RELEVANT-CODE")
-    sections.append("\n\n".join(code_section))
+            buf.write(f"\n\n###BEGIN-FILE: {display_path}\n{content}\n###END-FILE")
+    buf.write("\n\n##END-RELEVANT-CODE")
+    sections.append(buf.getvalue())
 
     # Additional Information
     addl = additional_info.strip()
     if addl:
         sections.append(
-            "##BEGIN-ADDITIONAL-INFORMATION\n" + addl + "\n##END-ADDITIONAL-INFORMATION"
+            f"##BEGIN-ADDITIONAL-INFORMATION\n{addl}\n##END-ADDITIONAL-INFORMATION"
         )
 
     # Template (Optional)
     tmpl = template_text.strip()
     if tmpl:
-        sections.append("##BEGIN-TEMPLATE\n" + tmpl + "\n##END-TEMPLATE")
+        sections.append(f"##BEGIN-TEMPLATE\n{tmpl}\n##END-TEMPLATE")
 
     return "\n\n".join(sections).strip()
 
@@ -945,7 +1350,6 @@ def generate_prompt(
 @app.callback(
     Output("final-prompt-output", "value"),
     Output("alert-no-files", "is_open"),
-    Output("download-link-container", "children"),
     Input("generate-button", "n_clicks"),
     State("folder-path", "value"),
     State("problem-description", "value"),
@@ -955,6 +1359,7 @@ def generate_prompt(
     State("prompt-template", "value"),
     State({"type": "file_checkbox", "index": ALL}, "id"),
     State({"type": "file_checkbox", "index": ALL}, "checked"),
+    State("tree-index-store", "data"),
 )
 # ----------------------------------------------------------------
 # REPLACED SECTION (3 of 3): Entire generate_final_prompt callback
@@ -969,21 +1374,27 @@ def generate_final_prompt(
     template_key,
     file_ids,
     file_checked,
+    tree_index,
 ):
     if not n_clicks:
-        return "", False, ""
+        return "", False
     if not folder_path or not os.path.isdir(folder_path):
-        return "", False, ""
+        return "", False
 
+    # Relative paths were computed once at tree-build time; fall back to
+    # os.path.relpath only for ids missing from the store.
+    rel_by_file = (tree_index or {}).get("rel_by_file") or {}
     selected_files = []
     if file_ids and file_checked:
         for fid, checked in zip(file_ids, file_checked):
             if checked:
-                rel_path = os.path.relpath(fid["index"], folder_path)
+                rel_path = rel_by_file.get(fid["index"]) or os.path.relpath(
+                    fid["index"], folder_path
+                )
                 selected_files.append(rel_path)
 
     if not selected_files:
-        return "", True, ""
+        return "", True
 
     source_files = read_selected_files(folder_path, selected_files)
     chosen_template_text = PROMPT_LIBRARY.get(template_key, "")
@@ -996,16 +1407,10 @@ def generate_final_prompt(
         template_text=chosen_template_text,
     )
 
-    final_prompt_encoded = final_prompt.replace("\n", "%0A").replace("#", "%23")
-    download_link = dbc.Button(
-        "Download Prompt",
-        id="download-btn",
-        href="data:text/plain;charset=utf-8," + final_prompt_encoded,
-        download="reasoning_prompt.txt",
-        external_link=True,
-        color="secondary",
-    )
-    return final_prompt, False, download_link
+    # The download button's href is filled in by a clientside callback that
+    # wraps the textarea content in a Blob, so the prompt is never encoded or
+    # shipped a second time for the download.
+    return final_prompt, False
 
 
 app.clientside_callback(
@@ -1028,11 +1433,41 @@ app.clientside_callback(
 )
 
 
-@app.callback(Output("copy-prompt-btn", "style"), Input("final-prompt-output", "value"))
-def hide_copy_button(prompt_text):
-    if not prompt_text.strip():
-        return {"display": "none"}
-    return {}
+# Toggling the copy button's visibility needs no server state; doing it in
+# the browser avoids a round-trip on every edit to the prompt textarea.
+app.clientside_callback(
+    """
+    function(prompt_text) {
+        return prompt_text && prompt_text.trim() ? {} : {display: "none"};
+    }
+    """,
+    Output("copy-prompt-btn", "style"),
+    Input("final-prompt-output", "value"),
+)
+
+
+# Build the download href from the textarea content in the browser: a Blob
+# object URL costs no server time and no second copy of the prompt over the
+# wire. The previous URL is revoked so repeated generations don't leak.
+app.clientside_callback(
+    """
+    function(content) {
+        if (window._promptBlobUrl) {
+            URL.revokeObjectURL(window._promptBlobUrl);
+            window._promptBlobUrl = null;
+        }
+        if (!content) return ["", {display: "none"}];
+        window._promptBlobUrl = URL.createObjectURL(
+            new Blob([content], {type: "text/plain"})
+        );
+        return [window._promptBlobUrl, {}];
+    }
+    """,
+    Output("download-btn", "href"),
+    Output("download-btn", "style"),
+    Input("final-prompt-output", "value"),
+    prevent_initial_call=True,
+)
 
 
 @app.callback(
@@ -1063,11 +1498,25 @@ def generate_diffs_callback(n_clicks, llm_text, folder_path):
         new_content = change["new_content"]
         file_path = os.path.join(folder_path, filename)
         if os.path.isfile(file_path):
-            original_content = read_entire_file(file_path)
+            try:
+                mtime_ns = os.stat(file_path).st_mtime_ns
+            except OSError:
+                # File vanished between the check and the stat; let
+                # read_entire_file produce its usual inline error comment.
+                original_content = read_entire_file(file_path)
+            else:
+                original_content = _read_cached(file_path, mtime_ns)
         else:
             original_content = ""
 
-        diff_html = generate_side_by_side_diff(original_content, new_content, filename)
+        if original_content == new_content:
+            # Multi-file LLM responses often include untouched files; skip
+            # the quadratic diff for those.
+            diff_html = f"<em>No changes — {html_escape(filename)} matches the pasted content.</em>"
+        else:
+            diff_html = generate_side_by_side_diff(
+                original_content, new_content, filename
+            )
         store_data.append(
             {
                 "filename": filename,
@@ -1087,15 +1536,17 @@ def generate_diffs_callback(n_clicks, llm_text, folder_path):
                         size="sm",
                         checked=True,
                     ),
-                    html.Div(
+                    # An iframe hands the diff markup straight to the
+                    # browser's HTML parser, so React never builds a VDOM
+                    # for it or re-parses it when sibling panels update.
+                    html.Iframe(
+                        srcDoc=diff_html,
                         style={
-                            "overflow": "auto",
+                            "width": "100%",
+                            "height": "400px",
                             "border": "1px solid #ccc",
                             "marginTop": "5px",
                         },
-                        children=html.Div(
-                            dangerouslySetInnerHTML={"__html": diff_html}
-                        ),
                     ),
                     html.Hr(),
                 ]
@@ -1148,6 +1599,12 @@ def apply_or_restore_callback(
             filename = cid["index"]
             apply_dict[filename] = check_val
 
+        # One timestamped sidecar directory per apply keeps the workspace
+        # free of *.bak clutter; shutil.copyfile uses zero-copy syscalls on
+        # platforms that support them.
+        backup_root = os.path.join(
+            folder_path, ".prompter_backups", time.strftime("%Y%m%d-%H%M%S")
+        )
         applied_files = []
         for item in parsed_changes:
             fn = item["filename"]
@@ -1157,8 +1614,9 @@ def apply_or_restore_callback(
             file_path = os.path.join(folder_path, fn)
             try:
                 if os.path.isfile(file_path):
-                    backup_file = file_path + ".bak"
-                    os.rename(file_path, backup_file)
+                    backup_file = os.path.join(backup_root, fn)
+                    os.makedirs(os.path.dirname(backup_file), exist_ok=True)
+                    shutil.copyfile(file_path, backup_file)
                     current_backups.append(
                         {"original_file": file_path, "backup_file": backup_file}
                     )
@@ -1181,7 +1639,7 @@ def apply_or_restore_callback(
                     }
                 )
             return (
-                f"Updated/created (old versions renamed to *.bak): {', '.join(applied_files)}",
+                f"Updated/created (old versions saved under .prompter_backups): {', '.join(applied_files)}",
                 True,
                 current_backups,
                 backup_options,
@@ -1211,9 +1669,9 @@ def apply_or_restore_callback(
         backup_file = backup_entry["backup_file"]
         original_file = backup_entry["original_file"]
         try:
-            if os.path.isfile(original_file):
-                os.remove(original_file)
-            os.rename(backup_file, original_file)
+            # Copy rather than move, so the snapshot survives the restore
+            # and can be re-applied later.
+            shutil.copyfile(backup_file, original_file)
             return (
                 f"Restored backup {os.path.basename(backup_file)} → {os.path.basename(original_file)}",
                 True,
@@ -1235,4 +1693,11 @@ def apply_or_restore_callback(
 server = app.server
 
 if __name__ == "__main__":
-    app.run_server(debug=True, port=8051)
+    # Debug mode (and its stat-every-module reloader) is opt-in so normal
+    # runs don't pay the reloader tax on each callback; use a WSGI server
+    # against `prompter.app:server` for real deployments.
+    app.run_server(
+        debug=os.environ.get("PROMPTER_DEBUG") == "1",
+        port=int(os.environ.get("PROMPTER_PORT", "8051")),
+        use_reloader=False,
+    )